@@ -89,6 +89,11 @@ std::set<std::size_t> Cell::get_all_fsr_ids() const {
   return ids;
 }
 
+std::vector<std::size_t> Cell::get_all_fsr_ids_sorted() const {
+  const auto ids = this->get_all_fsr_ids();
+  return std::vector<std::size_t>(ids.begin(), ids.end());
+}
+
 std::size_t Cell::get_num_fsr_instances(std::size_t id) const {
   // Each cell should only have up to 1 instance of a FSR
   for (const auto& fsr : fsrs_) {
@@ -385,6 +385,15 @@ CrossSection CrossSection::operator*(double N) const {
   return out;
 }
 
+void CrossSection::set_1g(double Et, double Ea) {
+  // Replaces the data with a 1-group cross section with no scattering,
+  // keeping the current name. This avoids constructing a temporary
+  // CrossSection (and its arrays) on the Python side just to call set.
+  this->set(CrossSection(xt::xtensor<double, 1>{Et}, xt::xtensor<double, 1>{Ea},
+                         xt::zeros<double>({std::size_t(1), std::size_t(1)}),
+                         name_));
+}
+
 void CrossSection::check_xs() {
   // Make correct number of groups
   if (ngroups() == 0) {
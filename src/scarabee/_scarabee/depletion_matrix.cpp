@@ -51,6 +51,50 @@ std::size_t DepletionMatrix::get_nuclide_index(
 
 void DepletionMatrix::exponential_product(std::span<double> N,
                                           bool cram48) const {
+  this->exponential_product_scaled(N, 1., cram48);
+}
+
+std::shared_ptr<DepletionMatrix> DepletionMatrix::weighted_sum(
+    const std::vector<double>& coeffs,
+    const std::vector<std::shared_ptr<const DepletionMatrix>>& mats) {
+  if (mats.empty()) {
+    const auto mssg = "No depletion matrices were provided for weighted sum.";
+    spdlog::error(mssg);
+    throw ScarabeeException(mssg);
+  }
+
+  if (coeffs.size() != mats.size()) {
+    const auto mssg =
+        "The number of coefficients does not agree with the number of "
+        "depletion matrices.";
+    spdlog::error(mssg);
+    throw ScarabeeException(mssg);
+  }
+
+  for (std::size_t i = 1; i < mats.size(); i++) {
+    if (mats[0]->same_nuclides(mats[0]->nuclides(), mats[i]->nuclides()) ==
+        false) {
+      const auto mssg = "Depletion matrices do not have the same nuclides.";
+      spdlog::error(mssg);
+      throw ScarabeeException(mssg);
+    }
+  }
+
+  // Accumulate directly on the sparse data, avoiding the temporary scaled
+  // copies that chaining the * and + operators would create.
+  auto out = std::make_shared<DepletionMatrix>(mats[0]->nuclides());
+  out->matrix_ = coeffs[0] * mats[0]->matrix_;
+  for (std::size_t i = 1; i < mats.size(); i++) {
+    out->matrix_ += coeffs[i] * mats[i]->matrix_;
+  }
+  out->compress();
+
+  return out;
+}
+
+void DepletionMatrix::exponential_product_scaled(std::span<double> N,
+                                                 double scale,
+                                                 bool cram48) const {
   if (N.size() != this->size()) {
     const auto mssg =
         "The number of provided number densities does not agree with the size "
@@ -79,20 +123,21 @@ void DepletionMatrix::exponential_product(std::span<double> N,
     alpha0 = cram16_alpha0_;
   }
 
-  detail_exp_product(N, theta, alpha, alpha0);
+  detail_exp_product(N, scale, theta, alpha, alpha0);
 }
 
 void DepletionMatrix::detail_exp_product(
-    std::span<double> N, std::span<const std::complex<double>> theta,
+    std::span<double> N, double scale,
+    std::span<const std::complex<double>> theta,
     std::span<const std::complex<double>> alpha, double alpha0) const {
   // Initialize the complex matrix
   Eigen::SparseMatrix<std::complex<double>> Acmplx(this->size(), this->size());
 
-  // Complex A is initialized as the current real matrix.
-  // Effectively completes Acmplx = matrix_;
+  // Complex A is initialized as the scaled current real matrix.
+  // Effectively completes Acmplx = scale * matrix_;
   for (int k = 0; k < matrix_.outerSize(); ++k) {
     for (Eigen::SparseMatrix<double>::InnerIterator it(matrix_, k); it; ++it) {
-      Acmplx.coeffRef(it.row(), it.col()) = {it.value(), 0.};
+      Acmplx.coeffRef(it.row(), it.col()) = {scale * it.value(), 0.};
     }
   }
   Acmplx.makeCompressed();
@@ -113,7 +158,7 @@ void DepletionMatrix::detail_exp_product(
   for (std::size_t i = 0; i < theta.size(); i++) {
     // Subtract theta[i] from diagonal
     for (std::size_t j = 0; j < this->size(); j++) {
-      Acmplx.coeffRef(j, j) = matrix_.coeff(j, j) - theta[i];
+      Acmplx.coeffRef(j, j) = scale * matrix_.coeff(j, j) - theta[i];
     }
 
     // Solve the system for Acmplx @ x = N
@@ -234,7 +279,8 @@ void fill_gain_terms(DepletionMatrix& matrix, const ChainEntry& nucinfo,
 
 std::shared_ptr<DepletionMatrix> build_depletion_matrix(
     std::shared_ptr<DepletionChain> chain, std::shared_ptr<Material> mat,
-    std::span<const double> flux, std::shared_ptr<NDLibrary> ndl) {
+    std::span<const double> flux, std::shared_ptr<NDLibrary> ndl,
+    std::shared_ptr<DepletionMatrix> out) {
   // Start by making a set of initial nuclides.
   // These are only the depletable nuclides !!
   std::set<std::string> initial_dep_nuclides;
@@ -251,9 +297,24 @@ std::shared_ptr<DepletionMatrix> build_depletion_matrix(
   std::vector<DepletionReactionRates> nuc_rrs =
       mat->compute_depletion_reaction_rates(flux, ndl);
 
-  // With this, we can build the matrix object
-  std::shared_ptr<DepletionMatrix> matrix_ptr =
-      std::make_shared<DepletionMatrix>(all_targets);
+  // With this, we can build the matrix object. If a workspace matrix with
+  // the same nuclides was provided, it is zeroed and refilled instead of
+  // allocating a new matrix.
+  std::shared_ptr<DepletionMatrix> matrix_ptr;
+  if (out != nullptr && out->size() == all_targets.size()) {
+    std::vector<std::string> sorted_targets = all_targets;
+    std::sort(sorted_targets.begin(), sorted_targets.end(),
+              [](const std::string& n1, const std::string& n2) {
+                return nuclide_name_to_za(n1) < nuclide_name_to_za(n2);
+              });
+    if (sorted_targets == out->nuclides()) {
+      out->zero();
+      matrix_ptr = out;
+    }
+  }
+  if (matrix_ptr == nullptr) {
+    matrix_ptr = std::make_shared<DepletionMatrix>(all_targets);
+  }
   DepletionMatrix& matrix = *matrix_ptr;
 
   // Now, go through each initial nuclide that is in the material and has
@@ -63,6 +63,8 @@ class CrossSection {
     (*this) = other;
   }
 
+  void set_1g(double Et, double Ea);
+
   std::size_t ngroups() const { return Etr_.ngroups(); }
 
   const std::string& name() const { return name_; }
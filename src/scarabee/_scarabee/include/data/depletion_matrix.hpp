@@ -42,6 +42,12 @@ class DepletionMatrix {
   void compress() { matrix_.makeCompressed(); }
 
   void exponential_product(std::span<double> N, bool cram48 = false) const;
+  void exponential_product_scaled(std::span<double> N, double scale,
+                                  bool cram48 = false) const;
+
+  static std::shared_ptr<DepletionMatrix> weighted_sum(
+      const std::vector<double>& coeffs,
+      const std::vector<std::shared_ptr<const DepletionMatrix>>& mats);
 
   DepletionMatrix& operator+=(const DepletionMatrix& A) {
     if (same_nuclides(this->nuclides(), A.nuclides()) == false) {
@@ -114,7 +120,7 @@ class DepletionMatrix {
     return true;
   }
 
-  void detail_exp_product(std::span<double> N,
+  void detail_exp_product(std::span<double> N, double scale,
                           std::span<const std::complex<double>> theta,
                           std::span<const std::complex<double>> alpha,
                           double alpha0) const;
@@ -131,7 +137,8 @@ class DepletionMatrix {
 
 std::shared_ptr<DepletionMatrix> build_depletion_matrix(
     std::shared_ptr<DepletionChain> chain, std::shared_ptr<Material> mat,
-    std::span<const double> flux, std::shared_ptr<NDLibrary> ndl);
+    std::span<const double> flux, std::shared_ptr<NDLibrary> ndl,
+    std::shared_ptr<DepletionMatrix> out = nullptr);
 
 }  // namespace scarabee
 
@@ -44,6 +44,8 @@ struct MaterialComposition {
   void add_leu(double enrichment, double frac);
   void add_nuclide(const std::string& name, double frac);
   void add_nuclide(const Nuclide& nuc);
+  void add_nuclides(const std::vector<std::string>& names,
+                    const std::vector<double>& fracs);
 
  private:
   friend class cereal::access;
@@ -77,6 +79,8 @@ class Material {
 
   bool has_component(const std::string& name) const;
   double atom_density(const std::string& name) const;
+  xt::xtensor<double, 1> atom_densities(
+      const std::vector<std::string>& names) const;
 
   double atoms_per_bcm() const { return atoms_per_bcm_; }
   double grams_per_cm3() const { return grams_per_cm3_; }
@@ -143,6 +147,15 @@ class Material {
   std::vector<MicroNuclideXS> micro_nuc_xs_data_;
   std::vector<MicroDepletionXS> micro_dep_xs_data_;
 
+  // Lazily computed in fissionable_grams_per_cm3. Not serialized, as it can
+  // always be recomputed from the composition.
+  mutable std::optional<double> fissionable_grams_per_cm3_;
+
+  // Per-group kappa * N * sigma_f factors, lazily computed in
+  // compute_fission_power_density and invalidated with the depletion micro
+  // xs data. Not serialized.
+  mutable std::vector<double> kappa_fission_;
+
   double calc_avg_molar_mass(const NDLibrary& ndl) const;
   void normalize_fractions();
 
@@ -69,6 +69,7 @@ class Cell {
   std::size_t ngroups() const { return fsrs_.front().xs()->ngroups(); }
 
   std::set<std::size_t> get_all_fsr_ids() const;
+  std::vector<std::size_t> get_all_fsr_ids_sorted() const;
 
   std::size_t get_num_fsr_instances(std::size_t id) const;
 
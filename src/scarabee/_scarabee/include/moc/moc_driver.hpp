@@ -92,6 +92,8 @@ class MOCDriver {
   xt::xtensor<double, 1> homogenize_flux_spectrum() const;
   xt::xtensor<double, 1> homogenize_flux_spectrum(
       const std::vector<std::size_t>& regions) const;
+  xt::xtensor<double, 2> homogenize_flux_spectra(
+      const std::vector<std::vector<std::size_t>>& regions_list) const;
 
   void apply_criticality_spectrum(const xt::xtensor<double, 1>& flux);
 
@@ -123,6 +125,9 @@ class MOCDriver {
   std::size_t get_fsr_indx(const UniqueFSR& fsr) const;
   std::size_t get_fsr_indx(std::size_t fsr_id, std::size_t instance) const;
 
+  std::vector<std::size_t> get_fsr_indxs(
+      const std::vector<std::size_t>& fsr_ids, std::size_t instance) const;
+
   std::vector<std::size_t> get_all_fsr_in_cell(const Vector& r,
                                                const Direction& u) const;
 
@@ -136,6 +141,9 @@ class MOCDriver {
   void set_extern_src(std::size_t i, std::size_t g, double src);
   double extern_src(std::size_t i, std::size_t g) const;
 
+  void set_extern_srcs(const std::vector<std::size_t>& inds, std::size_t g,
+                       double src);
+
   BoundaryCondition& x_min_bc() { return x_min_bc_; }
   const BoundaryCondition& x_min_bc() const { return x_min_bc_; }
 
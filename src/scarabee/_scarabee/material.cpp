@@ -144,6 +144,21 @@ void MaterialComposition::add_nuclide(const Nuclide& nuc) {
   nuclides.push_back(nuc);
 }
 
+void MaterialComposition::add_nuclides(const std::vector<std::string>& names,
+                                       const std::vector<double>& fracs) {
+  if (names.size() != fracs.size()) {
+    const auto mssg =
+        "Number of nuclide names does not agree with the number of fractions.";
+    spdlog::error(mssg);
+    throw ScarabeeException(mssg);
+  }
+
+  nuclides.reserve(nuclides.size() + names.size());
+  for (std::size_t i = 0; i < names.size(); i++) {
+    this->add_nuclide(names[i], fracs[i]);
+  }
+}
+
 Material::Material(const MaterialComposition& comp, double temp,
                    std::shared_ptr<NDLibrary> ndl)
     : composition_(comp),
@@ -309,6 +324,12 @@ void Material::set_temperature(double T) {
 }
 
 double Material::fissionable_grams_per_cm3() const {
+  // The composition and density of a Material cannot change after
+  // construction, so the value is only computed once and then cached.
+  if (fissionable_grams_per_cm3_.has_value()) {
+    return fissionable_grams_per_cm3_.value();
+  }
+
   double fiss_density = 0.;
 
   for (const auto& comp : composition_.nuclides) {
@@ -339,6 +360,7 @@ double Material::fissionable_grams_per_cm3() const {
 
   fiss_density *= atoms_per_bcm_ / N_AVAGADRO;
 
+  fissionable_grams_per_cm3_ = fiss_density;
   return fiss_density;
 }
 
@@ -353,6 +375,17 @@ double Material::atom_density(const std::string& name) const {
   return 0.;
 }
 
+xt::xtensor<double, 1> Material::atom_densities(
+    const std::vector<std::string>& names) const {
+  xt::xtensor<double, 1> densities = xt::zeros<double>({names.size()});
+
+  for (std::size_t i = 0; i < names.size(); i++) {
+    densities(i) = this->atom_density(names[i]);
+  }
+
+  return densities;
+}
+
 bool Material::has_component(const std::string& name) const {
   for (std::size_t i = 0; i < composition_.nuclides.size(); i++) {
     if (composition_.nuclides[i].name == name) {
@@ -576,32 +609,39 @@ std::shared_ptr<CrossSection> Material::two_term_xs(
 double Material::compute_fission_power_density(
     std::span<const double> flux,
     const std::shared_ptr<const NDLibrary> ndl) const {
-  double pd = 0.;
+  // The kappa * N * sigma_f factors only depend on the loaded depletion
+  // data, so they are computed per group once and cached. The power density
+  // is then a single inner product with the flux.
+  if (kappa_fission_.size() != flux.size()) {
+    kappa_fission_.assign(flux.size(), 0.);
 
-  for (std::size_t i = 0; i < composition_.nuclides.size(); i++) {
-    const auto& comp = composition_.nuclides[i];
-    const auto& nuc = ndl->get_nuclide(comp.name);
+    for (std::size_t i = 0; i < composition_.nuclides.size(); i++) {
+      const auto& comp = composition_.nuclides[i];
+      const auto& nuc = ndl->get_nuclide(comp.name);
 
-    if (nuc.fissile == false) continue;
+      if (nuc.fissile == false) continue;
 
-    const double Ni = comp.fraction * atoms_per_bcm_;
-    const double Q = nuc.fission_energy;
+      const double Ni = comp.fraction * atoms_per_bcm_;
+      const double Q = nuc.fission_energy;
 
-    if (micro_dep_xs_data_[i].n_fission.has_value() == false) {
-      const auto mssg = "Fissile nuclide " + comp.name +
-                        " has no loaded fission cross section.";
-      spdlog::error(mssg);
-      throw ScarabeeException(mssg);
-    }
+      if (micro_dep_xs_data_[i].n_fission.has_value() == false) {
+        const auto mssg = "Fissile nuclide " + comp.name +
+                          " has no loaded fission cross section.";
+        spdlog::error(mssg);
+        throw ScarabeeException(mssg);
+      }
 
-    const XS1D& sig_f = micro_dep_xs_data_[i].n_fission.value();
+      const XS1D& sig_f = micro_dep_xs_data_[i].n_fission.value();
 
-    double sig_f_flx_inner_prod = 0.;
-    for (std::size_t g = 0; g < flux.size(); g++) {
-      sig_f_flx_inner_prod += sig_f(g) * flux[g];
+      for (std::size_t g = 0; g < flux.size(); g++) {
+        kappa_fission_[g] += Q * Ni * sig_f(g);
+      }
     }
+  }
 
-    pd += Q * Ni * sig_f_flx_inner_prod;
+  double pd = 0.;
+  for (std::size_t g = 0; g < flux.size(); g++) {
+    pd += kappa_fission_[g] * flux[g];
   }
 
   return pd;
@@ -736,6 +776,10 @@ std::vector<DepletionReactionRates> Material::compute_depletion_reaction_rates(
 
 void Material::assign_resonant_xs(const std::size_t i, const std::size_t g,
                                   const ResonantOneGroupXS& res_data) {
+  // The fission cross section may change here, so the cached fission power
+  // factors must be recomputed.
+  kappa_fission_.clear();
+
   micro_nuc_xs_data_[i].Dtr.set_value(g, res_data.Dtr);
   micro_nuc_xs_data_[i].Ea.set_value(g, res_data.Ea);
   if (res_data.Ef != 0.) {
@@ -816,6 +860,8 @@ void Material::clear_transport_micro_xs_data() {
 void Material::clear_depletion_micro_xs_data() {
   micro_dep_xs_data_.clear();
   micro_dep_xs_data_.shrink_to_fit();
+  kappa_fission_.clear();
+  kappa_fission_.shrink_to_fit();
 }
 
 void Material::clear_all_micro_xs_data() {
@@ -1660,6 +1660,17 @@ std::size_t MOCDriver::get_fsr_indx(std::size_t fsr_id,
   return i;
 }
 
+std::vector<std::size_t> MOCDriver::get_fsr_indxs(
+    const std::vector<std::size_t>& fsr_ids, std::size_t instance) const {
+  std::vector<std::size_t> inds(fsr_ids.size(), 0);
+
+  for (std::size_t i = 0; i < fsr_ids.size(); i++) {
+    inds[i] = this->get_fsr_indx(fsr_ids[i], instance);
+  }
+
+  return inds;
+}
+
 std::vector<std::size_t> MOCDriver::get_all_fsr_in_cell(
     const Vector& r, const Direction& u) const {
   auto fsrs = geometry_->get_all_fsr_in_cell(r, u);
@@ -1697,6 +1708,13 @@ void MOCDriver::set_extern_src(const Vector& r, const Direction& u,
   extern_src_(g, i) = src;
 }
 
+void MOCDriver::set_extern_srcs(const std::vector<std::size_t>& inds,
+                                std::size_t g, double src) {
+  for (const auto i : inds) {
+    this->set_extern_src(i, g, src);
+  }
+}
+
 double MOCDriver::extern_src(const Vector& r, const Direction& u,
                              std::size_t g) const {
   std::size_t i = 0;
@@ -1918,6 +1936,19 @@ xt::xtensor<double, 1> MOCDriver::homogenize_flux_spectrum(
   return spectrum;
 }
 
+xt::xtensor<double, 2> MOCDriver::homogenize_flux_spectra(
+    const std::vector<std::vector<std::size_t>>& regions_list) const {
+  xt::xtensor<double, 2> spectra =
+      xt::zeros<double>({regions_list.size(), this->ngroups()});
+
+  for (std::size_t i = 0; i < regions_list.size(); i++) {
+    xt::view(spectra, i, xt::all()) =
+        this->homogenize_flux_spectrum(regions_list[i]);
+  }
+
+  return spectra;
+}
+
 void MOCDriver::apply_criticality_spectrum(const xt::xtensor<double, 1>& flux) {
   if (this->solved() == false) {
     auto mssg =
@@ -49,6 +49,16 @@ void init_Cell(py::module& m) {
            "set of int\n"
            "    IDs of all FSRs in the cell.")
 
+      .def("get_all_fsr_ids_sorted", &Cell::get_all_fsr_ids_sorted,
+           "Returns a list containing the IDs of all flat source regions in "
+           "the cell, sorted in increasing order. Since FSR IDs are assigned "
+           "monotonically, this is also the order in which the regions were "
+           "created.\n\n"
+           "Returns\n"
+           "-------\n"
+           "list of int\n"
+           "    Sorted IDs of all FSRs in the cell.")
+
       .def_property_readonly("num_fsrs", &Cell::num_fsrs,
                              "Number of flat source regions in the cell.")
 
@@ -225,6 +225,18 @@ void init_CrossSection(py::module& m) {
            "other : CrossSection\n"
            "    Cross section used to reinitialize the current data.\n")
 
+      .def("set_1g", &CrossSection::set_1g,
+           "Reinitializes to be a 1 group cross section with no scattering, "
+           "keeping the current name. This avoids constructing a temporary "
+           "CrossSection just to call set.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "Et : float\n"
+           "    Total cross section.\n"
+           "Ea : float\n"
+           "    Absorption cross section.\n",
+           py::arg("Et"), py::arg("Ea"))
+
       .def("Etr",
            py::overload_cast<std::size_t>(&CrossSection::Etr, py::const_),
            "Transport corrected total cross section in group g.\n\n"
@@ -400,5 +412,14 @@ void init_CrossSection(py::module& m) {
       .def("__iadd__", &CrossSection::operator+=)
 
       .def("__deepcopy__",
-           [](const CrossSection& xs, py::dict) { return CrossSection(xs); });
+           [](const CrossSection& xs, py::dict) { return CrossSection(xs); })
+
+      .def(
+          "clone", [](const CrossSection& xs) { return CrossSection(xs); },
+          "Returns a copy of this cross section. This is much faster than "
+          "copy.deepcopy, as the copy is made directly in C++.\n\n"
+          "Returns\n"
+          "-------\n"
+          "CrossSection\n"
+          "    Copy of this cross section.\n");
 }
@@ -73,6 +73,7 @@ void init_DepletionMatrix(py::module& m) {
           [](const DepletionMatrix& m, xt::pytensor<double, 1>& N,
              bool cram48 = false) {
             std::span<double> Nspn(N.data(), N.size());
+            py::gil_scoped_release release;
             m.exponential_product(Nspn, cram48);
           },
           "Computes the matrix product of the input vector N with the "
@@ -94,6 +95,56 @@ void init_DepletionMatrix(py::module& m) {
           "    is employed. Default value is False.\n",
           py::arg("N"), py::arg("cram48") = false)
 
+      .def(
+          "exponential_product_scaled",
+          [](const DepletionMatrix& m, xt::pytensor<double, 1>& N,
+             double scale, bool cram48 = false) {
+            std::span<double> Nspn(N.data(), N.size());
+            py::gil_scoped_release release;
+            m.exponential_product_scaled(Nspn, scale, cram48);
+          },
+          "Computes the matrix product of the input vector N with the "
+          "exponential of the depletion matrix multiplied by a scalar "
+          "(typically a time step). The array N is modified in place to "
+          "contain the result of this product.\n\n"
+          ".. math:: N' = \\exp{(c A)} N.\n\n"
+          "The scaling is applied inside the CRAM evaluation, so the matrix "
+          "itself is not modified. This avoids the two extra passes over the "
+          "matrix data that A *= c ... A /= c would require.\n\n"
+          "Parameters\n"
+          "----------\n"
+          "N : ndarray\n"
+          "    1D array of the number densities of the nuclides in the "
+          "    depletion matrix (in the same order). This array is modified"
+          "    in place, and will contain the result of the product after the"
+          "    function is complete.\n"
+          "scale : float\n"
+          "    Scalar multiplying the matrix in the exponential.\n"
+          "cram48 : bool\n"
+          "    If True, a 48th order CRAM is used. If False, a 16th order CRAM"
+          "    is employed. Default value is False.\n",
+          py::arg("N"), py::arg("scale"), py::arg("cram48") = false)
+
+      .def_static("weighted_sum", &DepletionMatrix::weighted_sum,
+                  py::call_guard<py::gil_scoped_release>(),
+                  "Computes the weighted sum of several depletion matrices "
+                  "with the same nuclides.\n\n"
+                  ".. math:: S = \\sum_i c_i A_i.\n\n"
+                  "The sum is accumulated directly on the sparse data, "
+                  "avoiding the temporary matrices that chaining the * and + "
+                  "operators would create.\n\n"
+                  "Parameters\n"
+                  "----------\n"
+                  "coeffs : list of float\n"
+                  "    Coefficient for each depletion matrix.\n"
+                  "mats : list of DepletionMatrix\n"
+                  "    Depletion matrices to sum.\n\n"
+                  "Returns\n"
+                  "-------\n"
+                  "DepletionMatrix\n"
+                  "    Weighted sum of the provided matrices.\n",
+                  py::arg("coeffs"), py::arg("mats"))
+
       .def("__getitem__",
            [](const DepletionMatrix& m,
               std::pair<std::size_t, std::size_t> indx) {
@@ -118,9 +169,11 @@ void init_DepletionMatrix(py::module& m) {
   m.def(
       "build_depletion_matrix",
       [](std::shared_ptr<DepletionChain> chain, std::shared_ptr<Material> mat,
-         const xt::pytensor<double, 1>& flux, std::shared_ptr<NDLibrary> ndl) {
+         const xt::pytensor<double, 1>& flux, std::shared_ptr<NDLibrary> ndl,
+         std::shared_ptr<DepletionMatrix> out) {
         std::span<const double> flux_spn(flux.data(), flux.size());
-        return build_depletion_matrix(chain, mat, flux_spn, ndl);
+        py::gil_scoped_release release;
+        return build_depletion_matrix(chain, mat, flux_spn, ndl, out);
       },
       "Builds a depletion matrix for a given material and flux spectrum.\n\n"
       "Parameters\n"
@@ -134,11 +187,16 @@ void init_DepletionMatrix(py::module& m) {
       "    1D Numpy array containing the flux spectrum.\n"
       "ndl : NDLibrary\n"
       "    Nuclear data library, needed for the group structure when "
-      "    calculating the average fission energy.\n\n"
+      "    calculating the average fission energy.\n"
+      "out : DepletionMatrix, optional\n"
+      "    Workspace matrix to reuse. If it holds the same nuclides as the "
+      "    matrix being built, it is zeroed and refilled in place (and "
+      "    returned); otherwise a new matrix is allocated.\n\n"
       "Returns\n"
       "-------\n"
       "DepletionMatrix\n"
       "    Depletion matrix for the provided material and flux spectrum. The "
       "    matrix has not been multiplied by any time step at this point.\n",
-      py::arg("chain"), py::arg("mat"), py::arg("flux"), py::arg("ndl"));
+      py::arg("chain"), py::arg("mat"), py::arg("flux"), py::arg("ndl"),
+      py::arg("out") = nullptr);
 }
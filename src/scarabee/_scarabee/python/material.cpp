@@ -105,6 +105,18 @@ void init_MaterialComposition(py::module& m) {
           "      :py:class:`Nuclide` giving the nuclide name and fraction.\n\n",
           py::arg("nuc"))
 
+      .def("add_nuclides", &MaterialComposition::add_nuclides,
+           "Adds several new nuclides to the material. This is equivalent to "
+           "calling add_nuclide once per nuclide, but only crosses the "
+           "Python/C++ boundary a single time.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "names : list of str\n"
+           "       Names of the nuclides.\n"
+           "fracs : list of float\n"
+           "       Fraction that each nuclide occupies in the material.\n\n",
+           py::arg("names"), py::arg("fracs"))
+
       .def("__deepcopy__", [](const MaterialComposition& comp) {
         return MaterialComposition(comp);
       });
@@ -187,6 +199,22 @@ void init_Material(py::module& m) {
            "      Number of atoms per barn-centimeter of desired nuclide.",
            py::arg("name"))
 
+      .def("atom_densities", &Material::atom_densities,
+           "Number of atoms per barn-centimeter for each of the indicated "
+           "nuclides. This is equivalent to calling atom_density once per "
+           "nuclide, but only crosses the Python/C++ boundary a single "
+           "time.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "names : list of str\n"
+           "       Names of the desired nuclides.\n\n"
+           "Returns\n"
+           "-------\n"
+           "ndarray of floats\n"
+           "      Number of atoms per barn-centimeter of each desired "
+           "nuclide.",
+           py::arg("names"))
+
       .def("carlvik_xs", &Material::carlvik_xs,
            "Computes the macroscopic material cross section, self-shielded "
            "according to the Carlvik two-term approximation.\n\n"
@@ -389,7 +417,16 @@ void init_Material(py::module& m) {
                     "String with the name of the Material.")
 
       .def("__deepcopy__",
-           [](const Material& mat, py::dict) { return Material(mat); });
+           [](const Material& mat, py::dict) { return Material(mat); })
+
+      .def(
+          "clone", [](const Material& mat) { return Material(mat); },
+          "Returns a copy of this material. This is much faster than "
+          "copy.deepcopy, as the copy is made directly in C++.\n\n"
+          "Returns\n"
+          "-------\n"
+          "Material\n"
+          "    Copy of this material.\n");
 
   py::enum_<MixingFraction>(m, "MixingFraction")
       .value("Atoms", MixingFraction::Atoms,
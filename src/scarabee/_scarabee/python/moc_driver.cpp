@@ -324,6 +324,23 @@ void init_MOCDriver(py::module& m) {
            "    Index in the MOCDriver of the specified FSR instance.\n",
            py::arg("fsr_id"), py::arg("instance"))
 
+      .def("get_fsr_indxs", &MOCDriver::get_fsr_indxs,
+           "Obtains the indices for a list of flat source region IDs, all "
+           "for the same instance. This is equivalent to calling "
+           "get_fsr_indx once per ID, but only crosses the Python/C++ "
+           "boundary a single time.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "fsr_ids : list of int\n"
+           "    Flat source region IDs.\n"
+           "instance : int\n"
+           "    Desired instance of the provided FSR IDs.\n\n"
+           "Returns\n"
+           "-------\n"
+           "list of int\n"
+           "    Indices in the MOCDriver of the specified FSR instances.\n",
+           py::arg("fsr_ids"), py::arg("instance"))
+
       .def("set_extern_src",
            py::overload_cast<const Vector&, const Direction&, std::size_t,
                              double>(&MOCDriver::set_extern_src),
@@ -354,6 +371,21 @@ void init_MOCDriver(py::module& m) {
            "      Value of source in the FSR.\n",
            py::arg("i"), py::arg("g"), py::arg("src"))
 
+      .def("set_extern_srcs", &MOCDriver::set_extern_srcs,
+           "Sets the external source to the same value in all of the Flat "
+           "Source Regions with the provided indices. This is equivalent to "
+           "calling set_extern_src once per index, but only crosses the "
+           "Python/C++ boundary a single time.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "inds : list of int\n"
+           "    Flat Source Region indices.\n"
+           "g : int\n"
+           "    Energy group index.\n"
+           "src : float\n"
+           "      Value of source in the FSRs.\n",
+           py::arg("inds"), py::arg("g"), py::arg("src"))
+
       .def("extern_src",
            py::overload_cast<const Vector&, const Direction&, std::size_t>(
                &MOCDriver::extern_src, py::const_),
@@ -442,6 +474,23 @@ void init_MOCDriver(py::module& m) {
            "                 Homogenized flux spectrum.",
            py::arg("regions"))
 
+      .def("homogenize_flux_spectra", &MOCDriver::homogenize_flux_spectra,
+           "Computes a homogenized flux spectrum for each of the provided "
+           "lists of region indices. This is equivalent to calling "
+           "homogenize_flux_spectrum once per list, but only crosses the "
+           "Python/C++ boundary a single time. This method will raise an "
+           "exception if the problem has not yet been solved.\n\n"
+           "Parameters\n"
+           "----------\n"
+           "regions_list : list of list of int\n"
+           "          Lists of regions for homogenization.\n"
+           "Returns\n"
+           "-------\n"
+           "ndarray of floats\n"
+           "                 2D array with one homogenized flux spectrum "
+           "per row.",
+           py::arg("regions_list"))
+
       .def("apply_criticality_spectrum", &MOCDriver::apply_criticality_spectrum,
            "Modifies the flux spectrum of the solved problem by multiplying "
            "the value of the flux by the ratio of the provided criticality "
@@ -1,4 +1,3 @@
-from matplotlib.streamplot import OutOfBounds
 from .._scarabee import (
     NDLibrary,
     MaterialComposition,
@@ -16,7 +15,41 @@ from .._scarabee import (
 )
 import numpy as np
 from typing import Optional, List
-import copy
+
+
+# Infinite-dilution arrays handed to Material.dilution_xs, keyed on the
+# number of nuclides and shared by all pins. The arrays are never mutated.
+_INF_DILUTIONS: dict = {}
+
+
+def _inf_dilutions(size: int) -> np.ndarray:
+    dils = _INF_DILUTIONS.get(size)
+    if dils is None:
+        dils = np.full(size, 1.0e10)
+        _INF_DILUTIONS[size] = dils
+    return dils
+
+
+# Minimum pin cell widths for each pin cell type, as multiples of the clad
+# radius: a 2 means the cell must hold the full diameter along that axis,
+# a 1 only the radius (split pins and quadrants).
+_PINTYPE_MIN_WIDTH_MULTS = {
+    PinCellType.Full: (2.0, 2.0),
+    PinCellType.XN: (1.0, 2.0),
+    PinCellType.XP: (1.0, 2.0),
+    PinCellType.YN: (2.0, 1.0),
+    PinCellType.YP: (2.0, 1.0),
+}
+
+
+def _build_1g_dancoff_xs(value: float, name: str) -> CrossSection:
+    """
+    Builds a 1-group pure-absorber CrossSection for Dancoff correction
+    calculations. A fresh object is returned every time: the Dancoff cross
+    sections are mutated in place (set_1g) over the life of a pin, so they
+    cannot be shared between pins.
+    """
+    return CrossSection(np.array([value]), np.array([value]), np.array([[0.0]]), name)
 
 
 class FuelPin:
@@ -49,9 +82,10 @@ class FuelPin:
         Outer radius of the fuel pellet region.
     fuel_ring_materials : list of list of Material
         Contains the Material in each fuel ring for each depletion time step.
-    fuel_ring_flux_spectra : list of list of ndarray
-        Contains the average flux spectrum in each fuel ring for each depletion
-        time step.
+    fuel_ring_flux_spectra : ndarray, optional
+        2D array of shape (num_fuel_rings, ngroups) with the average flux
+        spectrum in each fuel ring at the current depletion time step. Is None
+        until the first transport calculation has been performed.
     fuel_dancoff_corrections : list of float
         Dancoff corrections to be used when self-shielding the fuel at each
         depletion time step.
@@ -93,7 +127,10 @@ class FuelPin:
 
         # Mass of fissionable matter in g / cm (i.e. per unit length)
         self._initial_fissionable_linear_mass = (
-            fuel.fissionable_grams_per_cm3 * np.pi * self._fuel_radius**2.0
+            fuel.fissionable_grams_per_cm3
+            * np.pi
+            * self._fuel_radius
+            * self._fuel_radius
         )
 
         # Get gap related parameters
@@ -105,11 +142,11 @@ class FuelPin:
         if gap_radius is not None and gap_radius <= fuel_radius:
             raise ValueError("Gap radius must be > fuel radius.")
 
-        self._gap = copy.deepcopy(gap)
+        self._gap = gap.clone() if gap is not None else None
         self._gap_radius = gap_radius
 
         # Get cladding related parameters
-        self._clad = copy.deepcopy(clad)
+        self._clad = clad.clone()
 
         if clad_radius <= 0.0 or clad_radius <= fuel_radius:
             raise ValueError("Clad radius must be > fuel radius.")
@@ -129,24 +166,31 @@ class FuelPin:
 
         # Initialize empty variables for Dancoff correction calculations.
         # These are all kept private.
-        self._fuel_dancoff_xs: CrossSection = CrossSection(
-            np.array([1.0e5]), np.array([1.0e5]), np.array([[0.0]]), "Fuel"
-        )
+        self._fuel_dancoff_xs: CrossSection = _build_1g_dancoff_xs(1.0e5, "Fuel")
         self._gap_dancoff_xs: Optional[CrossSection] = None
         if self.gap is not None:
-            self._gap_dancoff_xs = CrossSection(
-                np.array([self.gap.potential_xs]),
-                np.array([self.gap.potential_xs]),
-                np.array([[0.0]]),
-                "Gap",
-            )
-        self._clad_dancoff_xs: CrossSection = CrossSection(
-            np.array([self.clad.potential_xs]),
-            np.array([self.clad.potential_xs]),
-            np.array([[0.0]]),
-            "Clad",
+            self._gap_dancoff_xs = _build_1g_dancoff_xs(self.gap.potential_xs, "Gap")
+        self._clad_dancoff_xs: CrossSection = _build_1g_dancoff_xs(
+            self.clad.potential_xs, "Clad"
         )
 
+        # The fuel rings all have equal volumes, so the volume fractions used
+        # when mixing the average fuel are constant.
+        self._fuel_ring_vols = [1.0 / self._num_fuel_rings] * self._num_fuel_rings
+
+        # Ring cross-sectional area in cm^2, combined with the MeV -> J
+        # conversion. Multiplying the summed ring fission power densities
+        # (MeV / cm^3 / s) by this factor gives a linear power in W / cm.
+        self._ring_area_J_per_MeV = (
+            np.pi * self._fuel_radius * self._fuel_radius / self._num_fuel_rings
+        ) * 1.6021766339999e-13
+
+        # Cache for the volume-averaged fuel mixture used in the clad Dancoff
+        # correction calculations. Holds the fuel ring materials it was
+        # computed from, so it is invalidated whenever depletion provides new
+        # materials.
+        self._avg_fuel_cache: Optional[tuple] = None
+
         self._fuel_isolated_dancoff_fsr_ids = []
         self._gap_isolated_dancoff_fsr_ids = []
         self._clad_isolated_dancoff_fsr_ids = []
@@ -170,50 +214,51 @@ class FuelPin:
         # ======================================================================
         # TRANSPORT CALCULATION DATA
         # ----------------------------------------------------------------------
-        # Lists of the FSR IDs for each fuel ring, used to homogenize flux
+        # Arrays of the FSR IDs for each fuel ring, used to homogenize flux
         # spectra for depletion. These will be filled by make_moc_cell.
-        self._fuel_ring_fsr_ids: List[List[int]] = []
-        for r in range(self.num_fuel_rings):
-            self._fuel_ring_fsr_ids.append([])
-        self._gap_fsr_ids: List[int] = []
-        self._clad_fsr_ids: List[int] = []
-        self._mod_fsr_ids: List[int] = []
+        self._fuel_ring_fsr_ids: List[np.ndarray] = [
+            np.empty(0, dtype=np.uint64) for r in range(self.num_fuel_rings)
+        ]
+        self._gap_fsr_ids: np.ndarray = np.empty(0, dtype=np.uint64)
+        self._clad_fsr_ids: np.ndarray = np.empty(0, dtype=np.uint64)
+        self._mod_fsr_ids: np.ndarray = np.empty(0, dtype=np.uint64)
 
-        self._fuel_ring_fsr_inds: List[List[int]] = []
-        for r in range(self.num_fuel_rings):
-            self._fuel_ring_fsr_inds.append([])
+        self._fuel_ring_fsr_inds: List[List[int]] = [
+            [] for r in range(self.num_fuel_rings)
+        ]
         self._gap_fsr_inds: List[int] = []
         self._clad_fsr_inds: List[int] = []
         self._mod_fsr_inds: List[int] = []
 
-        # Create list of the different radii for fuel pellet
-        self._fuel_radii = []
-        if self.num_fuel_rings == 1:
-            self._fuel_radii.append(self.fuel_radius)
-        else:
-            V = np.pi * self.fuel_radius * self.fuel_radius
-            Vr = V / self.num_fuel_rings
-            for ri in range(self.num_fuel_rings):
-                Rin = 0.0
-                if ri > 0:
-                    Rin = self._fuel_radii[-1]
-                Rout = np.sqrt((Vr + np.pi * Rin * Rin) / np.pi)
-                if Rout > self.fuel_radius:
-                    Rout = self.fuel_radius
-                self._fuel_radii.append(Rout)
+        # Create array of the different radii for fuel pellet. The rings all
+        # have equal volumes, so Ri = Rfuel * sqrt(i / N), and the last radius
+        # is exactly the fuel radius.
+        self._fuel_radii = self.fuel_radius * np.sqrt(
+            np.arange(1, self.num_fuel_rings + 1) / self.num_fuel_rings
+        )
+
+        # Escape cross section of the whole pellet, used when self-shielding
+        # an undiscretized (single ring) fuel region
+        self._Ee_single_ring = 1.0 / (2.0 * self._fuel_radius)
+
+        # (Rin, Rout) pair for each fuel ring, used when self-shielding the
+        # ring cross sections at every depletion step
+        self._fuel_ring_bounds = [
+            (0.0 if ri == 0 else self._fuel_radii[ri - 1], self._fuel_radii[ri])
+            for ri in range(self.num_fuel_rings)
+        ]
 
         # Initialize array of compositions for the fuel. This holds the
         # composition for each fuel ring and for each depletion step.
         self._fuel_ring_materials: List[List[Material]] = []
         for r in range(self.num_fuel_rings):
             # All rings initially start with the same composition
-            self._fuel_ring_materials.append([copy.deepcopy(fuel)])
+            self._fuel_ring_materials.append([fuel.clone()])
 
-        # Initialize an array to hold the flux spectrum for each fuel ring.
-        self._fuel_ring_flux_spectra: List[np.ndarray] = []
-        for r in range(self.num_fuel_rings):
-            # All rings initially start with empty flux spectrum list
-            self._fuel_ring_flux_spectra.append(np.array([]))
+        # Array holding the flux spectrum for each fuel ring, of shape
+        # (num_fuel_rings, ngroups). It is lazily allocated on the first call
+        # to obtain_flux_spectra, once the group structure is known.
+        self._fuel_ring_flux_spectra: Optional[np.ndarray] = None
 
         # Initialize an array to hold the depletion matrices for the previous and current steps.
         self._fuel_ring_prev_dep_mats: List[Optional[DepletionMatrix]] = []
@@ -223,6 +268,12 @@ class FuelPin:
             self._fuel_ring_prev_dep_mats.append(None)
             self._fuel_ring_current_dep_mats.append(None)
 
+        # Workspace matrices for the corrector, reused from one depletion
+        # step to the next when the nuclide set does not change.
+        self._fuel_ring_corr_dep_ws: List[Optional[DepletionMatrix]] = [
+            None
+        ] * self.num_fuel_rings
+
         # Holds all the CrossSection objects used for the real transport
         # calculation. These are NOT stored for each depletion step like with
         # the materials.
@@ -230,6 +281,19 @@ class FuelPin:
         self._gap_xs: Optional[CrossSection] = None
         self._clad_xs: Optional[CrossSection] = None
 
+        # Cache of self-shielded cladding cross sections keyed on the Dancoff
+        # correction. The cladding composition never changes with depletion,
+        # so repeated corrections can reuse the same cross section data.
+        self._clad_xs_cache: dict = {}
+
+        # Indicate whether the transport cross section names had to be
+        # defaulted (the materials carried no name). Recorded when the cross
+        # sections are first built, so later updates can reapply the default
+        # with a single attribute write instead of a get-check-set per call.
+        self._fuel_xs_names_defaulted = False
+        self._gap_xs_name_defaulted = False
+        self._clad_xs_name_defaulted = False
+
     @property
     def fuel_radius(self) -> float:
         return self._fuel_radius
@@ -247,8 +311,8 @@ class FuelPin:
         return self._fuel_ring_materials
 
     @property
-    def fuel_ring_flux_spectra(self) -> List[List[Material]]:
-        return self._fuel_ring_materials
+    def fuel_ring_flux_spectra(self) -> Optional[np.ndarray]:
+        return self._fuel_ring_flux_spectra
 
     @property
     def fuel_dancoff_corrections(self) -> List[float]:
@@ -275,42 +339,19 @@ class FuelPin:
         return self._clad_dancoff_corrections
 
     def _check_dx_dy(self, dx, dy, pintype):
-        if pintype == PinCellType.Full:
-            if dx < 2.0 * self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell x width must be > the diameter of the cladding."
-                )
-            if dy < 2.0 * self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell y width must be > the diameter of the cladding."
-                )
-        elif pintype in [PinCellType.XN, PinCellType.XP]:
-            if dx < self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell x width must be > the radius of the cladding."
-                )
-            if dy < 2.0 * self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell y width must be > the diameter of the cladding."
-                )
-        elif pintype in [PinCellType.YN, PinCellType.YP]:
-            if dy < self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell y width must be > the radius of the cladding."
-                )
-            if dx < 2.0 * self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell x width must be > the diameter of the cladding."
-                )
-        else:
-            if dx < self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell x width must be > the radius of the cladding."
-                )
-            if dy < self.clad_radius:
-                raise ValueError(
-                    "The fuel pin cell y width must be > the radius of the cladding."
-                )
+        mx, my = _PINTYPE_MIN_WIDTH_MULTS.get(pintype, (1.0, 1.0))
+        rc = self.clad_radius
+
+        if dx < mx * rc:
+            raise ValueError(
+                "The fuel pin cell x width must be > the "
+                f"{'diameter' if mx == 2.0 else 'radius'} of the cladding."
+            )
+        if dy < my * rc:
+            raise ValueError(
+                "The fuel pin cell y width must be > the "
+                f"{'diameter' if my == 2.0 else 'radius'} of the cladding."
+            )
 
     def load_nuclides(self, ndl: NDLibrary) -> None:
         """
@@ -375,44 +416,90 @@ class FuelPin:
             Average density of the nuclide at depletion time step t across the
             fuel pellet in units of atoms per barn-cm.
         """
+        num_rings = self.num_fuel_rings
         sum_density = 0.0
 
-        for r in range(self.num_fuel_rings):
+        for r in range(num_rings):
             mat = self.get_fuel_material(t, r)
             sum_density += mat.atom_density(nuclide)
 
-        return sum_density / self.num_fuel_rings
+        return sum_density / num_rings
+
+    def get_average_fuel_nuclide_densities(
+        self, t: int, nuclides: List[str]
+    ) -> np.ndarray:
+        """
+        Computes the average density of several nuclides within the fuel
+        pellet at a single depletion time step. Each ring material is queried
+        with a single batched call, making this much faster than calling
+        get_average_fuel_nuclide_density once per nuclide.
+
+        Parameters
+        ----------
+        t : int
+            Depletion time step index.
+        nuclides : list of str
+            Names of the nuclides.
+
+        Returns
+        -------
+        ndarray
+            Average density of each nuclide at depletion time step t across
+            the fuel pellet in units of atoms per barn-cm.
+        """
+        num_rings = self.num_fuel_rings
+        sum_densities = np.zeros(len(nuclides))
+
+        for r in range(num_rings):
+            mat = self.get_fuel_material(t, r)
+            sum_densities += mat.atom_densities(nuclides)
+
+        return sum_densities / num_rings
 
     # ==========================================================================
     # Dancoff Correction Related Methods
+    def _get_avg_fuel(self, ndl: NDLibrary) -> Material:
+        """
+        Returns the volume-averaged fuel mixture across all fuel rings at the
+        last depletion time step. The mixture is cached, and only recomputed
+        when the fuel ring materials have changed.
+
+        Parameters
+        ----------
+        ndl : NDLibrary
+            Nuclear data library for obtaining potential scattering cross
+            sections.
+
+        Returns
+        -------
+        Material
+            Volume-averaged fuel material.
+        """
+        fuel_mats = [ring[-1] for ring in self._fuel_ring_materials]
+
+        if self._avg_fuel_cache is not None and all(
+            mat is cached_mat
+            for mat, cached_mat in zip(fuel_mats, self._avg_fuel_cache[0])
+        ):
+            return self._avg_fuel_cache[1]
+
+        avg_fuel: Material = mix_materials(
+            fuel_mats, self._fuel_ring_vols, MixingFraction.Volume, ndl
+        )
+
+        self._avg_fuel_cache = (tuple(fuel_mats), avg_fuel)
+        return avg_fuel
+
     def set_xs_for_fuel_dancoff_calculation(self) -> None:
         """
         Sets the 1-group cross sections to calculate the fuel Dancoff correction.
         """
-        self._fuel_dancoff_xs.set(
-            CrossSection(
-                np.array([1.0e5]), np.array([1.0e5]), np.array([[0.0]]), "Fuel"
-            )
-        )
+        self._fuel_dancoff_xs.set_1g(1.0e5, 1.0e5)
 
         if self._gap_dancoff_xs is not None and self.gap is not None:
-            self._gap_dancoff_xs.set(
-                CrossSection(
-                    np.array([self.gap.potential_xs]),
-                    np.array([self.gap.potential_xs]),
-                    np.array([[0.0]]),
-                    "Gap",
-                )
-            )
+            self._gap_dancoff_xs.set_1g(self.gap.potential_xs, self.gap.potential_xs)
 
-        self._clad_dancoff_xs.set(
-            CrossSection(
-                np.array([self.clad.potential_xs]),
-                np.array([self.clad.potential_xs]),
-                np.array([[0.0]]),
-                "Clad",
-            )
-        )
+        self._clad_dancoff_xs.set_1g(self.clad.potential_xs, self.clad.potential_xs)
 
     def set_xs_for_clad_dancoff_calculation(self, ndl: NDLibrary) -> None:
         """
@@ -425,42 +512,14 @@ class FuelPin:
             sections.
         """
         # Create average fuel mixture
-        fuel_mats = []
-        fuel_vols = []
-        for ring in self.fuel_ring_materials:
-            fuel_mats.append(ring[-1])
-            fuel_vols.append(1.0 / self.num_fuel_rings)
-        avg_fuel: Material = mix_materials(
-            fuel_mats, fuel_vols, MixingFraction.Volume, ndl
-        )
+        avg_fuel = self._get_avg_fuel(ndl)
 
-        self._fuel_dancoff_xs.set(
-            CrossSection(
-                np.array([avg_fuel.potential_xs]),
-                np.array([avg_fuel.potential_xs]),
-                np.array([[0.0]]),
-                "Fuel",
-            )
-        )
+        self._fuel_dancoff_xs.set_1g(avg_fuel.potential_xs, avg_fuel.potential_xs)
 
         if self._gap_dancoff_xs is not None and self.gap is not None:
-            self._gap_dancoff_xs.set(
-                CrossSection(
-                    np.array([self.gap.potential_xs]),
-                    np.array([self.gap.potential_xs]),
-                    np.array([[0.0]]),
-                    "Gap",
-                )
-            )
+            self._gap_dancoff_xs.set_1g(self.gap.potential_xs, self.gap.potential_xs)
 
-        self._clad_dancoff_xs.set(
-            CrossSection(
-                np.array([1.0e5]),
-                np.array([1.0e5]),
-                np.array([[0.0]]),
-                "Clad",
-            )
-        )
+        self._clad_dancoff_xs.set_1g(1.0e5, 1.0e5)
 
     def make_dancoff_moc_cell(
         self,
@@ -517,28 +576,29 @@ class FuelPin:
         # Make the simple pin cell.
         cell = SimplePinCell(radii, xs, dx, dy, pintype)
 
-        # Get the FSR IDs for the regions of interest
-        cell_fsr_ids = list(cell.get_all_fsr_ids())
-        cell_fsr_ids.sort()
+        # Get the FSR IDs for the regions of interest (sorted, which is also
+        # the order in which the regions were created)
+        cell_fsr_ids = cell.get_all_fsr_ids_sorted()
 
         if isolated:
-            self._fuel_isolated_dancoff_fsr_ids.append(cell_fsr_ids[0])
-            if self.gap is None:
-                self._clad_isolated_dancoff_fsr_ids.append(cell_fsr_ids[1])
-                self._mod_isolated_dancoff_fsr_ids.append(cell_fsr_ids[2])
-            else:
-                self._gap_isolated_dancoff_fsr_ids.append(cell_fsr_ids[1])
-                self._clad_isolated_dancoff_fsr_ids.append(cell_fsr_ids[2])
-                self._mod_isolated_dancoff_fsr_ids.append(cell_fsr_ids[3])
+            fuel_ids = self._fuel_isolated_dancoff_fsr_ids
+            gap_ids = self._gap_isolated_dancoff_fsr_ids
+            clad_ids = self._clad_isolated_dancoff_fsr_ids
+            mod_ids = self._mod_isolated_dancoff_fsr_ids
         else:
-            self._fuel_full_dancoff_fsr_ids.append(cell_fsr_ids[0])
-            if self.gap is None:
-                self._clad_full_dancoff_fsr_ids.append(cell_fsr_ids[1])
-                self._mod_full_dancoff_fsr_ids.append(cell_fsr_ids[2])
-            else:
-                self._gap_full_dancoff_fsr_ids.append(cell_fsr_ids[1])
-                self._clad_full_dancoff_fsr_ids.append(cell_fsr_ids[2])
-                self._mod_full_dancoff_fsr_ids.append(cell_fsr_ids[3])
+            fuel_ids = self._fuel_full_dancoff_fsr_ids
+            gap_ids = self._gap_full_dancoff_fsr_ids
+            clad_ids = self._clad_full_dancoff_fsr_ids
+            mod_ids = self._mod_full_dancoff_fsr_ids
+
+        fuel_ids.append(cell_fsr_ids[0])
+        if self.gap is None:
+            clad_ids.append(cell_fsr_ids[1])
+            mod_ids.append(cell_fsr_ids[2])
+        else:
+            gap_ids.append(cell_fsr_ids[1])
+            clad_ids.append(cell_fsr_ids[2])
+            mod_ids.append(cell_fsr_ids[3])
 
         return cell
 
@@ -556,33 +616,128 @@ class FuelPin:
         fullmoc : MOCDriver
             MOC simulation for the full geometry.
         """
-        self._fuel_isolated_dancoff_fsr_inds = []
-        self._gap_isolated_dancoff_fsr_inds = []
-        self._clad_isolated_dancoff_fsr_inds = []
-        self._mod_isolated_dancoff_fsr_inds = []
+        # The ID lists accumulate as plain Python lists while the Dancoff
+        # cells are built. Freeze them into typed arrays here, so that all
+        # later per-step calls hand pybind a contiguous buffer of unboxed
+        # integers.
+        self._fuel_isolated_dancoff_fsr_ids = np.asarray(
+            self._fuel_isolated_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._gap_isolated_dancoff_fsr_ids = np.asarray(
+            self._gap_isolated_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._clad_isolated_dancoff_fsr_ids = np.asarray(
+            self._clad_isolated_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._mod_isolated_dancoff_fsr_ids = np.asarray(
+            self._mod_isolated_dancoff_fsr_ids, dtype=np.uint64
+        )
 
-        self._fuel_full_dancoff_fsr_inds = []
-        self._gap_full_dancoff_fsr_inds = []
-        self._clad_full_dancoff_fsr_inds = []
-        self._mod_full_dancoff_fsr_inds = []
+        self._fuel_full_dancoff_fsr_ids = np.asarray(
+            self._fuel_full_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._gap_full_dancoff_fsr_ids = np.asarray(
+            self._gap_full_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._clad_full_dancoff_fsr_ids = np.asarray(
+            self._clad_full_dancoff_fsr_ids, dtype=np.uint64
+        )
+        self._mod_full_dancoff_fsr_ids = np.asarray(
+            self._mod_full_dancoff_fsr_ids, dtype=np.uint64
+        )
+
+        # Batch the ID -> index lookups so that each list only requires a
+        # single crossing of the Python/C++ boundary.
+        self._fuel_isolated_dancoff_fsr_inds = np.asarray(
+            isomoc.get_fsr_indxs(self._fuel_isolated_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._gap_isolated_dancoff_fsr_inds = np.asarray(
+            isomoc.get_fsr_indxs(self._gap_isolated_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._clad_isolated_dancoff_fsr_inds = np.asarray(
+            isomoc.get_fsr_indxs(self._clad_isolated_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._mod_isolated_dancoff_fsr_inds = np.asarray(
+            isomoc.get_fsr_indxs(self._mod_isolated_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+
+        self._fuel_full_dancoff_fsr_inds = np.asarray(
+            fullmoc.get_fsr_indxs(self._fuel_full_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._gap_full_dancoff_fsr_inds = np.asarray(
+            fullmoc.get_fsr_indxs(self._gap_full_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._clad_full_dancoff_fsr_inds = np.asarray(
+            fullmoc.get_fsr_indxs(self._clad_full_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+        self._mod_full_dancoff_fsr_inds = np.asarray(
+            fullmoc.get_fsr_indxs(self._mod_full_dancoff_fsr_ids, 0),
+            dtype=np.uint64,
+        )
+
+    def _set_dancoff_sources(
+        self,
+        moc: MOCDriver,
+        moderator: Material,
+        isolated: bool,
+        fuel_src: float,
+        clad_src: float,
+    ) -> None:
+        """
+        Initializes the fixed sources for a MOC calculation required in
+        computing Dancoff corrections. The gap and moderator sources are
+        always their potential cross sections; the fuel and clad sources
+        depend on whether a fuel or clad Dancoff correction is computed.
+
+        Parameters
+        ----------
+        moc : MOCDriver
+            MOC simulation for the isolated pin or the full geometry.
+        moderator : Material
+            Material definition for the moderator, used to obtain the potential
+            scattering cross section.
+        isolated : bool
+            If True, the sources are set in the FSRs of the isolated pin.
+            Otherwise, they are set in the FSRs of the full geometry.
+        fuel_src : float
+            Source in the fuel regions.
+        clad_src : float
+            Source in the cladding regions.
+        """
+        if isolated:
+            fuel_inds = self._fuel_isolated_dancoff_fsr_inds
+            gap_inds = self._gap_isolated_dancoff_fsr_inds
+            clad_inds = self._clad_isolated_dancoff_fsr_inds
+            mod_inds = self._mod_isolated_dancoff_fsr_inds
+        else:
+            fuel_inds = self._fuel_full_dancoff_fsr_inds
+            gap_inds = self._gap_full_dancoff_fsr_inds
+            clad_inds = self._clad_full_dancoff_fsr_inds
+            mod_inds = self._mod_full_dancoff_fsr_inds
 
-        for id in self._fuel_isolated_dancoff_fsr_ids:
-            self._fuel_isolated_dancoff_fsr_inds.append(isomoc.get_fsr_indx(id, 0))
-        for id in self._gap_isolated_dancoff_fsr_ids:
-            self._gap_isolated_dancoff_fsr_inds.append(isomoc.get_fsr_indx(id, 0))
-        for id in self._clad_isolated_dancoff_fsr_ids:
-            self._clad_isolated_dancoff_fsr_inds.append(isomoc.get_fsr_indx(id, 0))
-        for id in self._mod_isolated_dancoff_fsr_ids:
-            self._mod_isolated_dancoff_fsr_inds.append(isomoc.get_fsr_indx(id, 0))
-
-        for id in self._fuel_full_dancoff_fsr_ids:
-            self._fuel_full_dancoff_fsr_inds.append(fullmoc.get_fsr_indx(id, 0))
-        for id in self._gap_full_dancoff_fsr_ids:
-            self._gap_full_dancoff_fsr_inds.append(fullmoc.get_fsr_indx(id, 0))
-        for id in self._clad_full_dancoff_fsr_ids:
-            self._clad_full_dancoff_fsr_inds.append(fullmoc.get_fsr_indx(id, 0))
-        for id in self._mod_full_dancoff_fsr_ids:
-            self._mod_full_dancoff_fsr_inds.append(fullmoc.get_fsr_indx(id, 0))
+        # Skip the regions with no FSRs (e.g. a pin that only appears in one
+        # of the isolated or full geometries), avoiding pointless crossings of
+        # the Python/C++ boundary.
+        if len(fuel_inds) > 0:
+            moc.set_extern_srcs(fuel_inds, 0, fuel_src)
+
+        # Gap sources should all be potential_xs
+        if self.gap is not None and len(gap_inds) > 0:
+            moc.set_extern_srcs(gap_inds, 0, self.gap.potential_xs)
+
+        if len(clad_inds) > 0:
+            moc.set_extern_srcs(clad_inds, 0, clad_src)
+
+        # Moderator sources should all be potential_xs
+        if len(mod_inds) > 0:
+            moc.set_extern_srcs(mod_inds, 0, moderator.potential_xs)
 
     def set_isolated_dancoff_fuel_sources(
         self, isomoc: MOCDriver, moderator: Material
@@ -600,25 +755,10 @@ class FuelPin:
             Material definition for the moderator, used to obtain the potential
             scattering cross section.
         """
-        # Fuel sources should all be zero !
-        for ind in self._fuel_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, 0.0)
-
-        # Gap sources should all be potential_xs
-        if self.gap is not None:
-            pot_xs = self.gap.potential_xs
-            for ind in self._gap_isolated_dancoff_fsr_inds:
-                isomoc.set_extern_src(ind, 0, pot_xs)
-
-        # Clad sources should all be potential_xs
-        pot_xs = self.clad.potential_xs
-        for ind in self._clad_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, pot_xs)
-
-        # Moderator sources should all be potential_xs
-        pot_xs = moderator.potential_xs
-        for ind in self._mod_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, pot_xs)
+        # Fuel sources should all be zero, clad sources potential_xs
+        self._set_dancoff_sources(
+            isomoc, moderator, True, 0.0, self.clad.potential_xs
+        )
 
     def set_isolated_dancoff_clad_sources(
         self, isomoc: MOCDriver, moderator: Material, ndl: NDLibrary
@@ -639,35 +779,10 @@ class FuelPin:
             Nuclear data library for obtaining potential scattering cross
             sections.
         """
-        # Create average fuel mixture
-        fuel_mats = []
-        fuel_vols = []
-        for ring in self.fuel_ring_materials:
-            fuel_mats.append(ring[-1])
-            fuel_vols.append(1.0 / self.num_fuel_rings)
-        avg_fuel: Material = mix_materials(
-            fuel_mats, fuel_vols, MixingFraction.Volume, ndl
-        )
-
-        # Fuel sources should all be potential_xs
-        pot_xs = avg_fuel.potential_xs
-        for ind in self._fuel_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, pot_xs)
-
-        # Gap sources should all be potential_xs
-        if self.gap is not None:
-            pot_xs = self.gap.potential_xs
-            for ind in self._gap_isolated_dancoff_fsr_inds:
-                isomoc.set_extern_src(ind, 0, pot_xs)
-
-        # Clad sources should all be zero !
-        for ind in self._clad_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, 0.0)
-
-        # Moderator sources should all be potential_xs
-        pot_xs = moderator.potential_xs
-        for ind in self._mod_isolated_dancoff_fsr_inds:
-            isomoc.set_extern_src(ind, 0, pot_xs)
+        # Fuel sources should all be the average fuel potential_xs, clad
+        # sources zero
+        avg_fuel = self._get_avg_fuel(ndl)
+        self._set_dancoff_sources(isomoc, moderator, True, avg_fuel.potential_xs, 0.0)
 
     def set_full_dancoff_fuel_sources(
         self, fullmoc: MOCDriver, moderator: Material
@@ -685,25 +800,10 @@ class FuelPin:
             Material definition for the moderator, used to obtain the potential
             scattering cross section.
         """
-        # Fuel sources should all be zero !
-        for ind in self._fuel_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, 0.0)
-
-        # Gap sources should all be potential_xs
-        if self.gap is not None:
-            pot_xs = self.gap.potential_xs
-            for ind in self._gap_full_dancoff_fsr_inds:
-                fullmoc.set_extern_src(ind, 0, pot_xs)
-
-        # Clad sources should all be potential_xs
-        pot_xs = self.clad.potential_xs
-        for ind in self._clad_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, pot_xs)
-
-        # Moderator sources should all be potential_xs
-        pot_xs = moderator.potential_xs
-        for ind in self._mod_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, pot_xs)
+        # Fuel sources should all be zero, clad sources potential_xs
+        self._set_dancoff_sources(
+            fullmoc, moderator, False, 0.0, self.clad.potential_xs
+        )
 
     def set_full_dancoff_clad_sources(
         self, fullmoc: MOCDriver, moderator: Material, ndl: NDLibrary
@@ -724,38 +824,19 @@ class FuelPin:
             Nuclear data library for obtaining potential scattering cross
             sections.
         """
-        # Create average fuel mixture
-        fuel_mats = []
-        fuel_vols = []
-        for ring in self.fuel_ring_materials:
-            fuel_mats.append(ring[-1])
-            fuel_vols.append(1.0 / self.num_fuel_rings)
-        avg_fuel: Material = mix_materials(
-            fuel_mats, fuel_vols, MixingFraction.Volume, ndl
+        # Fuel sources should all be the average fuel potential_xs, clad
+        # sources zero
+        avg_fuel = self._get_avg_fuel(ndl)
+        self._set_dancoff_sources(
+            fullmoc, moderator, False, avg_fuel.potential_xs, 0.0
         )
 
-        # Fuel sources should all be potential_xs
-        pot_xs = avg_fuel.potential_xs
-        for ind in self._fuel_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, pot_xs)
-
-        # Gap sources should all be potential_xs
-        if self.gap is not None:
-            pot_xs = self.gap.potential_xs
-            for ind in self._gap_full_dancoff_fsr_inds:
-                fullmoc.set_extern_src(ind, 0, pot_xs)
-
-        # Clad sources should all be zero !
-        for ind in self._clad_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, 0.0)
-
-        # Moderator sources should all be potential_xs
-        pot_xs = moderator.potential_xs
-        for ind in self._mod_full_dancoff_fsr_inds:
-            fullmoc.set_extern_src(ind, 0, pot_xs)
-
     def compute_fuel_dancoff_correction(
-        self, isomoc: MOCDriver, fullmoc: MOCDriver
+        self,
+        isomoc: MOCDriver,
+        fullmoc: MOCDriver,
+        iso_flux: Optional[float] = None,
+        full_flux: Optional[float] = None,
     ) -> float:
         """
         Computes the Dancoff correction for the fuel region of the fuel pin.
@@ -763,25 +844,39 @@ class FuelPin:
         Parameters
         ----------
         isomoc : MOCDriver
-            MOC simulation for the isolated geometry (previously solved).
+            MOC simulation for the isolated pin (previously solved).
         fullmoc : MOCDriver
             MOC simulation for the full geometry (previously solved).
+        iso_flux : float, optional
+            Homogenized 1-group flux in the fuel of the isolated pin. If not
+            provided, it is computed from isomoc. Callers treating many pins
+            can obtain the fluxes for all of them in a single call with
+            MOCDriver.homogenize_flux_spectra.
+        full_flux : float, optional
+            Homogenized 1-group flux in the fuel of the full geometry. If not
+            provided, it is computed from fullmoc.
 
         Returns
         -------
         float
             Dancoff correction for the fuel region.
         """
-        iso_flux = isomoc.homogenize_flux_spectrum(
-            self._fuel_isolated_dancoff_fsr_inds
-        )[0]
-        full_flux = fullmoc.homogenize_flux_spectrum(self._fuel_full_dancoff_fsr_inds)[
-            0
-        ]
+        if iso_flux is None:
+            iso_flux = isomoc.homogenize_flux_spectrum(
+                self._fuel_isolated_dancoff_fsr_inds
+            )[0]
+        if full_flux is None:
+            full_flux = fullmoc.homogenize_flux_spectrum(
+                self._fuel_full_dancoff_fsr_inds
+            )[0]
         return (iso_flux - full_flux) / iso_flux
 
     def compute_clad_dancoff_correction(
-        self, isomoc: MOCDriver, fullmoc: MOCDriver
+        self,
+        isomoc: MOCDriver,
+        fullmoc: MOCDriver,
+        iso_flux: Optional[float] = None,
+        full_flux: Optional[float] = None,
     ) -> float:
         """
         Computes the Dancoff correction for the cladding region of the fuel pin.
@@ -789,21 +884,31 @@ class FuelPin:
         Parameters
         ----------
         isomoc : MOCDriver
-            MOC simulation for the isolated geometry (previously solved).
+            MOC simulation for the isolated pin (previously solved).
         fullmoc : MOCDriver
             MOC simulation for the full geometry (previously solved).
+        iso_flux : float, optional
+            Homogenized 1-group flux in the cladding of the isolated pin. If
+            not provided, it is computed from isomoc. Callers treating many
+            pins can obtain the fluxes for all of them in a single call with
+            MOCDriver.homogenize_flux_spectra.
+        full_flux : float, optional
+            Homogenized 1-group flux in the cladding of the full geometry. If
+            not provided, it is computed from fullmoc.
 
         Returns
         -------
         float
             Dancoff correction for the cladding region.
         """
-        iso_flux = isomoc.homogenize_flux_spectrum(
-            self._clad_isolated_dancoff_fsr_inds
-        )[0]
-        full_flux = fullmoc.homogenize_flux_spectrum(self._clad_full_dancoff_fsr_inds)[
-            0
-        ]
+        if iso_flux is None:
+            iso_flux = isomoc.homogenize_flux_spectrum(
+                self._clad_isolated_dancoff_fsr_inds
+            )[0]
+        if full_flux is None:
+            full_flux = fullmoc.homogenize_flux_spectrum(
+                self._clad_full_dancoff_fsr_inds
+            )[0]
         return (iso_flux - full_flux) / iso_flux
 
     def append_fuel_dancoff_correction(self, C) -> None:
@@ -838,8 +943,69 @@ class FuelPin:
             )
         self._clad_dancoff_corrections.append(C)
 
+    def extend_fuel_dancoff_corrections(self, Cs) -> None:
+        """
+        Saves several new Dancoff corrections for the fuel at once, validated
+        with a single vectorized check. This is preferable to calling
+        append_fuel_dancoff_correction in a loop when pushing a whole
+        depletion schedule.
+
+        Parameters
+        ----------
+        Cs : iterable of float
+            New Dancoff corrections, in chronological order.
+        """
+        arr = np.asarray(Cs, dtype=np.float64)
+        if np.any((arr < 0.0) | (arr > 1.0)):
+            raise ValueError("Dancoff corrections must be in range [0, 1].")
+        self._fuel_dancoff_corrections.extend(arr.tolist())
+
+    def extend_clad_dancoff_corrections(self, Cs) -> None:
+        """
+        Saves several new Dancoff corrections for the cladding at once,
+        validated with a single vectorized check. This is preferable to
+        calling append_clad_dancoff_correction in a loop when pushing a whole
+        depletion schedule.
+
+        Parameters
+        ----------
+        Cs : iterable of float
+            New Dancoff corrections, in chronological order.
+        """
+        arr = np.asarray(Cs, dtype=np.float64)
+        if np.any((arr < 0.0) | (arr > 1.0)):
+            raise ValueError("Dancoff corrections must be in range [0, 1].")
+        self._clad_dancoff_corrections.extend(arr.tolist())
+
     # ==========================================================================
     # Transport Calculation Related Methods
+    def _set_single_ring_fuel_xs(self, t: int, ndl: NDLibrary) -> None:
+        """
+        Creates or updates the CrossSection object of an undiscretized
+        (single ring) fuel pellet for the specified depletion step.
+
+        Parameters
+        ----------
+        t : int
+            Index for the depletion step.
+        ndl : NDLibrary
+            Nuclear data library to use for cross sections.
+        """
+        xs_new = self._fuel_ring_materials[0][t].carlvik_xs(
+            self._fuel_dancoff_corrections[t], self._Ee_single_ring, ndl
+        )
+
+        if self._fuel_ring_xs:
+            # Reset XS values. Cannot reassign or pointers will be broken !
+            self._fuel_ring_xs[0].set(xs_new)
+            if self._fuel_xs_names_defaulted:
+                self._fuel_ring_xs[0].name = "Fuel"
+        else:
+            if xs_new.name == "":
+                xs_new.name = "Fuel"
+                self._fuel_xs_names_defaulted = True
+            self._fuel_ring_xs.append(xs_new)
+
     def set_fuel_xs_for_depletion_step(self, t: int, ndl: NDLibrary) -> None:
         """
         Constructs the CrossSection object for all fuel rings of the pin at the
@@ -856,63 +1022,40 @@ class FuelPin:
         if len(self._fuel_ring_xs) == 0:
             # Create initial CrossSection objects
             if self.num_fuel_rings == 1:
-                # Compute escape xs
-                Ee = 1.0 / (2.0 * self.fuel_radius)
-                self._fuel_ring_xs.append(
-                    self._fuel_ring_materials[0][t].carlvik_xs(
-                        self._fuel_dancoff_corrections[t], Ee, ndl
-                    )
-                )
-                if self._fuel_ring_xs[-1].name == "":
-                    self._fuel_ring_xs[-1].name = "Fuel"
+                self._set_single_ring_fuel_xs(t, ndl)
             else:
-                # Do each ring
+                # Do each ring. Each ring holds its own Material, so the
+                # self-shielding must be run ring by ring; the Dancoff
+                # correction and ring bounds are hoisted out of the loop.
+                C = self._fuel_dancoff_corrections[t]
                 for ri in range(self.num_fuel_rings):
-                    Rin = 0.0
-                    if ri > 0:
-                        Rin = self._fuel_radii[ri - 1]
-                    Rout = self._fuel_radii[ri]
+                    Rin, Rout = self._fuel_ring_bounds[ri]
                     self._fuel_ring_xs.append(
                         self._fuel_ring_materials[ri][t].ring_carlvik_xs(
-                            self._fuel_dancoff_corrections[t],
-                            self.fuel_radius,
-                            Rin,
-                            Rout,
-                            ndl,
+                            C, self.fuel_radius, Rin, Rout, ndl
                         )
                     )
                     if self._fuel_ring_xs[-1].name == "":
                         self._fuel_ring_xs[-1].name = "Fuel"
+                        self._fuel_xs_names_defaulted = True
 
         elif len(self._fuel_ring_xs) == self.num_fuel_rings:
             # Reset XS values. Cannot reassign or pointers will be broken !
             if self.num_fuel_rings == 1:
-                # Compute escape xs
-                Ee = 1.0 / (2.0 * self.fuel_radius)
-                self._fuel_ring_xs[0].set(
-                    self._fuel_ring_materials[0][t].carlvik_xs(
-                        self._fuel_dancoff_corrections[t], Ee, ndl
-                    )
-                )
-                if self._fuel_ring_xs[0].name == "":
-                    self._fuel_ring_xs[0].name = "Fuel"
+                self._set_single_ring_fuel_xs(t, ndl)
             else:
-                # Do each ring
+                # Do each ring. Each ring holds its own Material, so the
+                # self-shielding must be run ring by ring; the Dancoff
+                # correction and ring bounds are hoisted out of the loop.
+                C = self._fuel_dancoff_corrections[t]
                 for ri in range(self.num_fuel_rings):
-                    Rin = 0.0
-                    if ri > 0:
-                        Rin = self._fuel_radii[ri - 1]
-                    Rout = self._fuel_radii[ri]
+                    Rin, Rout = self._fuel_ring_bounds[ri]
                     self._fuel_ring_xs[ri].set(
                         self._fuel_ring_materials[ri][t].ring_carlvik_xs(
-                            self._fuel_dancoff_corrections[t],
-                            self.fuel_radius,
-                            Rin,
-                            Rout,
-                            ndl,
+                            C, self.fuel_radius, Rin, Rout, ndl
                         )
                     )
-                    if self._fuel_ring_xs[ri].name == "":
+                    if self._fuel_xs_names_defaulted:
                         self._fuel_ring_xs[ri].name = "Fuel"
         else:
             raise RuntimeError(
@@ -930,13 +1073,16 @@ class FuelPin:
             Nuclear data library to use for cross sections.
         """
         if self.gap is not None:
+            dils = _inf_dilutions(self.gap.size)
             if self._gap_xs is None:
-                self._gap_xs = self.gap.dilution_xs([1.0e10] * self.gap.size, ndl)
+                self._gap_xs = self.gap.dilution_xs(dils, ndl)
+                if self._gap_xs.name == "":
+                    self._gap_xs.name = "Gap"
+                    self._gap_xs_name_defaulted = True
             else:
-                self._gap_xs.set(self.gap.dilution_xs([1.0e10] * self.gap.size, ndl))
-
-            if self._gap_xs.name == "":
-                self._gap_xs.name = "Gap"
+                self._gap_xs.set(self.gap.dilution_xs(dils, ndl))
+                if self._gap_xs_name_defaulted:
+                    self._gap_xs.name = "Gap"
 
     def set_clad_xs_for_depletion_step(self, t: int, ndl: NDLibrary) -> None:
         """
@@ -958,18 +1104,26 @@ class FuelPin:
         else:
             Ee = 1.0 / (2.0 * (self.clad_radius - self.fuel_radius))
 
-        # Get / set the xs
+        # Get the xs, reusing a previously computed one if this Dancoff
+        # correction has been seen before (the cladding composition does not
+        # change with depletion)
+        C = self._clad_dancoff_corrections[t]
+        xs_new = self._clad_xs_cache.get(C)
+        if xs_new is None:
+            xs_new = self.clad.roman_xs(C, Ee, ndl)
+            self._clad_xs_cache[C] = xs_new
+
+        # Set the xs. The cached object is never handed out directly, as
+        # self._clad_xs is mutated in place on later updates.
         if self._clad_xs is None:
-            self._clad_xs = self.clad.roman_xs(
-                self._clad_dancoff_corrections[t], Ee, ndl
-            )
+            self._clad_xs = xs_new.clone()
+            if self._clad_xs.name == "":
+                self._clad_xs.name = "Clad"
+                self._clad_xs_name_defaulted = True
         else:
-            self._clad_xs.set(
-                self.clad.roman_xs(self._clad_dancoff_corrections[t], Ee, ndl)
-            )
-
-        if self._clad_xs.name == "":
-            self._clad_xs.name = "Clad"
+            self._clad_xs.set(xs_new)
+            if self._clad_xs_name_defaulted:
+                self._clad_xs.name = "Clad"
 
     def make_moc_cell(
         self,
@@ -1006,8 +1160,8 @@ class FuelPin:
         self._check_dx_dy(dx, dy, pintype)
 
         # Initialize the radii and cross section lists with the fuel info
-        radii = [r for r in self._fuel_radii]
-        xss = [xs for xs in self._fuel_ring_xs]
+        radii = list(self._fuel_radii)
+        xss = list(self._fuel_ring_xs)
 
         # Add the gap (if present)
         if self._gap_xs is not None:
@@ -1019,25 +1173,29 @@ class FuelPin:
         xss.append(self._clad_xs)
 
         # Add another ring of moderator if possible
-        if pintype == PinCellType.Full and min(dx, dy) > 2.0 * self.clad_radius:
-            radii.append(0.5 * min(dx, dy))
-            xss.append(moderator_xs)
+        rc = self.clad_radius
+        two_rc = 2.0 * rc
+        min_dxdy = min(dx, dy)
+        mod_ring_radius = None
+        if pintype == PinCellType.Full and min_dxdy > two_rc:
+            mod_ring_radius = 0.5 * min_dxdy
         elif (
-            pintype in [PinCellType.XN, PinCellType.XP]
-            and dx > self.clad_radius
-            and dy > 2.0 * self.clad_radius
+            pintype in (PinCellType.XN, PinCellType.XP)
+            and dx > rc
+            and dy > two_rc
         ):
-            radii.append(min(dx, 0.5 * dy))
-            xss.append(moderator_xs)
+            mod_ring_radius = min(dx, 0.5 * dy)
         elif (
-            pintype in [PinCellType.YN, PinCellType.YP]
-            and dy > self.clad_radius
-            and dx > 2.0 * self.clad_radius
+            pintype in (PinCellType.YN, PinCellType.YP)
+            and dy > rc
+            and dx > two_rc
         ):
-            radii.append(min(0.5 * dx, dy))
-            xss.append(moderator_xs)
-        elif dx > self.clad_radius and dy > self.clad_radius:
-            radii.append(min(dx, dy))
+            mod_ring_radius = min(0.5 * dx, dy)
+        elif dx > rc and dy > rc:
+            mod_ring_radius = min_dxdy
+
+        if mod_ring_radius is not None:
+            radii.append(mod_ring_radius)
             xss.append(moderator_xs)
 
         # Add moderator to the end of materials
@@ -1046,9 +1204,9 @@ class FuelPin:
         # Create the cell object
         cell = PinCell(radii, xss, dx, dy, pintype)
 
-        # Get the FSR IDs for the regions of interest
-        cell_fsr_ids = list(cell.get_all_fsr_ids())
-        cell_fsr_ids.sort()
+        # Get the FSR IDs for the regions of interest (sorted, which is also
+        # the order in which the regions were created)
+        cell_fsr_ids = np.asarray(cell.get_all_fsr_ids_sorted(), dtype=np.uint64)
 
         # Number of angular divisions
         NA = 8
@@ -1065,23 +1223,20 @@ class FuelPin:
         I = 0  # Starting index for cell_fsr_inds
         # Go through all rings, and get FSR IDs
         for r in range(self.num_fuel_rings):
-            for a in range(NA):
-                self._fuel_ring_fsr_ids[r].append(cell_fsr_ids[I])
-                I += 1
+            self._fuel_ring_fsr_ids[r] = cell_fsr_ids[I : I + NA]
+            I += NA
 
         # Get the FSRs for the gap, if present
         if self._gap_xs is not None:
-            for a in range(NA):
-                self._gap_fsr_ids.append(cell_fsr_ids[I])
-                I += 1
+            self._gap_fsr_ids = cell_fsr_ids[I : I + NA]
+            I += NA
 
         # Get the FSRs for the cladding
-        for a in range(NA):
-            self._clad_fsr_ids.append(cell_fsr_ids[I])
-            I += 1
+        self._clad_fsr_ids = cell_fsr_ids[I : I + NA]
+        I += NA
 
         # Everything else should be a moderator FSR
-        self._mod_fsr_ids = list(cell_fsr_ids[I:])
+        self._mod_fsr_ids = cell_fsr_ids[I:]
 
         return cell
 
@@ -1095,22 +1250,14 @@ class FuelPin:
         moc : MOCDriver
             MOC simulation for the full calculations.
         """
-        self._fuel_ring_fsr_inds: List[List[int]] = []
-        for r in range(self.num_fuel_rings):
-            self._fuel_ring_fsr_inds.append([])
-        self._gap_fsr_inds: List[int] = []
-        self._clad_fsr_inds: List[int] = []
-        self._mod_fsr_inds: List[int] = []
-
-        for r in range(self.num_fuel_rings):
-            for id in self._fuel_ring_fsr_ids[r]:
-                self._fuel_ring_fsr_inds[r].append(moc.get_fsr_indx(id, 0))
-        for id in self._gap_fsr_ids:
-            self._gap_fsr_inds.append(moc.get_fsr_indx(id, 0))
-        for id in self._clad_fsr_ids:
-            self._clad_fsr_inds.append(moc.get_fsr_indx(id, 0))
-        for id in self._mod_fsr_ids:
-            self._mod_fsr_inds.append(moc.get_fsr_indx(id, 0))
+        # Batch the ID -> index lookups so that each list only requires a
+        # single crossing of the Python/C++ boundary.
+        self._fuel_ring_fsr_inds = [
+            moc.get_fsr_indxs(ids, 0) for ids in self._fuel_ring_fsr_ids
+        ]
+        self._gap_fsr_inds = moc.get_fsr_indxs(self._gap_fsr_ids, 0)
+        self._clad_fsr_inds = moc.get_fsr_indxs(self._clad_fsr_ids, 0)
+        self._mod_fsr_inds = moc.get_fsr_indxs(self._mod_fsr_ids, 0)
 
     def obtain_flux_spectra(self, moc: MOCDriver) -> None:
         """
@@ -1123,9 +1270,16 @@ class FuelPin:
             MOC simulation for the full calculations.
         """
         for r in range(self.num_fuel_rings):
-            self._fuel_ring_flux_spectra[r] = moc.homogenize_flux_spectrum(
-                self._fuel_ring_fsr_inds[r]
-            )
+            flux = moc.homogenize_flux_spectrum(self._fuel_ring_fsr_inds[r])
+
+            if self._fuel_ring_flux_spectra is None:
+                # Allocate the (num_fuel_rings, ngroups) array now that the
+                # group structure is known
+                self._fuel_ring_flux_spectra = np.empty(
+                    (self.num_fuel_rings, flux.size)
+                )
+
+            self._fuel_ring_flux_spectra[r, :] = flux
 
     def compute_pin_linear_power(self, ndl: NDLibrary):
         """
@@ -1144,14 +1298,12 @@ class FuelPin:
             Linear power density in w / cm.
         """
         power = 0.0
-        A = np.pi * self.fuel_radius**2.0 / self.num_fuel_rings
         for r in range(self.num_fuel_rings):
             mat = self._fuel_ring_materials[r][-1]
             flux = self._fuel_ring_flux_spectra[r]
-            power += A * mat.compute_fission_power_density(flux, ndl)
-        # Convert from MeV/cm/s to J/cm/s = w/cm
-        power *= 1.6021766339999e-13
-        return power
+            power += mat.compute_fission_power_density(flux, ndl)
+        # Apply ring area and convert from MeV/cm/s to J/cm/s = w/cm
+        return self._ring_area_J_per_MeV * power
 
     def normalize_flux_spectrum(self, f) -> None:
         """
@@ -1166,8 +1318,9 @@ class FuelPin:
         if f <= 0.0:
             raise ValueError("Normalization factor must be > 0.")
 
-        for r in range(self.num_fuel_rings):
-            self._fuel_ring_flux_spectra[r] *= f
+        # The spectra are stored as one 2D array, so all rings are scaled
+        # with a single in-place multiply
+        self._fuel_ring_flux_spectra *= f
 
     def predict_depletion(
         self,
@@ -1198,6 +1351,15 @@ class FuelPin:
         if dt <= 0:
             raise ValueError("Predictor time step must be > 0.")
 
+        # The LE/QI combination coefficients are identical for every fuel
+        # ring, so compute them once, with the time step folded in. This also
+        # removes the extra *= dt pass over the matrix data.
+        if dtm1 is not None:
+            F1_cm1 = -dt * dt / (12.0 * dtm1)
+            F1_c0 = dt * (6.0 * dtm1 + dt) / (12.0 * dtm1)
+            F2_cm1 = -5.0 * dt * dt / (12.0 * dtm1)
+            F2_c0 = dt * (6.0 * dtm1 + 5.0 * dt) / (12.0 * dtm1)
+
         # Do the prediction step for each fuel ring
         for r in range(self.num_fuel_rings):
             # Get the flux and initial material
@@ -1215,44 +1377,32 @@ class FuelPin:
             mat.clear_all_micro_xs_data()
 
             # Initialize an array with the initial target number densities
-            N = np.zeros(A0.size)
             nuclides = A0.nuclides
-            for i, nuclide in enumerate(nuclides):
-                N[i] = mat.atom_density(nuclide)
+            N = mat.atom_densities(nuclides)
 
             if self._fuel_ring_prev_dep_mats[r] is None or dtm1 is None:
-                # Use CE/LI
-                A0 *= dt
-
-                # Do the matrix exponential
-                A0.exponential_product(N)
-
-                # Undo multiplication by time step on the matrix
-                A0 /= dt
+                # Use CE/LI. The time step is folded into the CRAM evaluation,
+                # leaving A0 itself untouched.
+                A0.exponential_product_scaled(N, dt)
 
             else:
                 # Use LE/QI
                 Am1 = self._fuel_ring_prev_dep_mats[r]
 
-                F1 = (-dt / (12.0 * dtm1)) * Am1 + (
-                    (6.0 * dtm1 + dt) / (12.0 * dtm1)
-                ) * A0
-                F1 *= dt
-
-                F2 = (-5.0 * dt / (12.0 * dtm1)) * Am1 + (
-                    (6.0 * dtm1 + 5.0 * dt) / (12.0 * dtm1)
-                ) * A0
-                F2 *= dt
+                F1 = DepletionMatrix.weighted_sum([F1_cm1, F1_c0], [Am1, A0])
+                F2 = DepletionMatrix.weighted_sum([F2_cm1, F2_c0], [Am1, A0])
 
                 # Do the matrix exponentials
                 F2.exponential_product(N)
                 F1.exponential_product(N)
 
-            # Now we can build a new material composition
+            # Now we can build a new material composition from the nuclides
+            # with positive number densities
+            mask = N > 0.0
             new_mat_comp = MaterialComposition()
-            for i, nuclide in enumerate(nuclides):
-                if N[i] > 0.0:
-                    new_mat_comp.add_nuclide(nuclide, N[i])
+            new_mat_comp.add_nuclides(
+                [nuc for nuc, keep in zip(nuclides, mask) if keep], N[mask]
+            )
 
             # Make the new material
             new_mat = Material(new_mat_comp, mat.temperature, ndl)
@@ -1286,6 +1436,20 @@ class FuelPin:
         if dt <= 0:
             raise ValueError("Corrector time step must be > 0.")
 
+        # The combination coefficients are identical for every fuel ring, so
+        # compute them once, with the time step folded in. This also removes
+        # the extra *= dt pass over the matrix data in the LE/QI branch.
+        F1_c0 = dt / 12.0
+        F1_cp1 = 5.0 * dt / 12.0
+        if dtm1 is not None:
+            denom = 12.0 * dtm1 * (dtm1 + dt)
+            F3_cm1 = -dt * dt * dt / denom
+            F3_c0 = dt * (5.0 * dtm1 * dtm1 + 6.0 * dtm1 * dt + dt * dt) / denom
+            F3_cp1 = dt * dtm1 / (12.0 * (dtm1 + dt))
+            F4_cm1 = F3_cm1
+            F4_c0 = dt * (dtm1 * dtm1 + 2.0 * dtm1 * dt + dt * dt) / denom
+            F4_cp1 = dt * (5.0 * dtm1 + 4.0 * dt) / (12.0 * (dtm1 + dt))
+
         # Do the prediction step for each fuel ring
         for r in range(self.num_fuel_rings):
             # Get the flux and initial material
@@ -1295,20 +1459,22 @@ class FuelPin:
             # Get depletion matrix for beginning of time step
             A0 = self._fuel_ring_current_dep_mats[r]
 
-            # Build depletion matrix and multiply by time step
-            Ap1 = build_depletion_matrix(chain, mat_pred, flux, ndl)
+            # Build depletion matrix, reusing last step's corrector matrix as
+            # a workspace (it is not referenced anywhere else)
+            Ap1 = build_depletion_matrix(
+                chain, mat_pred, flux, ndl, out=self._fuel_ring_corr_dep_ws[r]
+            )
+            self._fuel_ring_corr_dep_ws[r] = Ap1
 
             # Initialize an array with the initial target number densities
             mat_old = self._fuel_ring_materials[r][-2]  # Go 2 steps back !!
-            N = np.zeros(Ap1.size)
             nuclides = Ap1.nuclides
-            for i, nuclide in enumerate(nuclides):
-                N[i] = mat_old.atom_density(nuclide)
+            N = mat_old.atom_densities(nuclides)
 
             if self._fuel_ring_prev_dep_mats[r] is None or dtm1 is None:
                 # Use CE/LI
-                F1 = (dt / 12.0) * A0 + (5.0 * dt / 12.0) * Ap1
-                F2 = (5.0 * dt / 12.0) * A0 + (dt / 12.0) * Ap1
+                F1 = DepletionMatrix.weighted_sum([F1_c0, F1_cp1], [A0, Ap1])
+                F2 = DepletionMatrix.weighted_sum([F1_cp1, F1_c0], [A0, Ap1])
 
                 F2.exponential_product(N)
                 F1.exponential_product(N)
@@ -1319,36 +1485,23 @@ class FuelPin:
                 # Get previous depletion matrix
                 Am1 = self._fuel_ring_prev_dep_mats[r]
 
-                F3 = (
-                    (-dt * dt / (12.0 * dtm1 * (dtm1 + dt))) * Am1
-                    + (
-                        (5.0 * dtm1 * dtm1 + 6.0 * dtm1 * dt + dt * dt)
-                        / (12.0 * dtm1 * (dtm1 + dt))
-                    )
-                    * A0
-                    + (dtm1 / (12.0 * (dtm1 + dt))) * Ap1
+                F3 = DepletionMatrix.weighted_sum(
+                    [F3_cm1, F3_c0, F3_cp1], [Am1, A0, Ap1]
                 )
-                F3 *= dt
-
-                F4 = (
-                    (-dt * dt / (12.0 * dtm1 * (dtm1 + dt))) * Am1
-                    + (
-                        (dtm1 * dtm1 + 2.0 * dtm1 * dt + dt * dt)
-                        / (12.0 * dtm1 * (dtm1 + dt))
-                    )
-                    * A0
-                    + ((5.0 * dtm1 + 4.0 * dt) / (12.0 * (dtm1 + dt))) * Ap1
+                F4 = DepletionMatrix.weighted_sum(
+                    [F4_cm1, F4_c0, F4_cp1], [Am1, A0, Ap1]
                 )
-                F4 *= dt
 
                 F4.exponential_product(N)
                 F3.exponential_product(N)
 
-            # Now we can build a new material composition
+            # Now we can build a new material composition from the nuclides
+            # with positive number densities
+            mask = N > 0.0
             new_mat_comp = MaterialComposition()
-            for i, nuclide in enumerate(nuclides):
-                if N[i] > 0.0:
-                    new_mat_comp.add_nuclide(nuclide, N[i])
+            new_mat_comp.add_nuclides(
+                [nuc for nuc, keep in zip(nuclides, mask) if keep], N[mask]
+            )
 
             # Make the new material
             new_mat = Material(new_mat_comp, mat_pred.temperature, ndl)